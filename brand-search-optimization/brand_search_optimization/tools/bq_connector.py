@@ -14,16 +14,20 @@
 
 """Defines tools for brand search optimization agent"""
 
+import logging
+
 from google.cloud import bigquery
 from google.adk.tools import ToolContext
 
 from ..shared_libraries import constants
 
+logger = logging.getLogger(__name__)
+
 # Initialize the BigQuery client outside the function
 try:
     client = bigquery.Client()  # Initialize client once
 except Exception as e:
-    print(f"Error initializing BigQuery client: {e}")
+    logger.error("Error initializing BigQuery client: %s", e)
     client = None  # Set client to None if initialization fails
 
 
@@ -35,7 +39,8 @@ def get_product_details_for_brand(tool_context: ToolContext):
         tool_context (str): The tool_context to search for (using a LIKE '%brand%' query).
 
     Returns:
-        str: A markdown table containing the product details, or an error message if BigQuery client initialization failed.
+        str: A markdown table containing the product details, or an error message if BigQuery client initialization failed
+             or if the brand is empty or whitespace-only (in which case no query is run).
              The table includes columns for 'Title', 'Description', 'Attributes', and 'Brand'.
              Returns a maximum of 3 results.
 
@@ -47,6 +52,10 @@ def get_product_details_for_brand(tool_context: ToolContext):
     if client is None:  # Check if client initialization failed
         return "BigQuery client initialization failed. Cannot execute query."
 
+    # An empty brand would match every row, so skip the query entirely.
+    if not brand or not brand.strip():
+        return "No brand provided. Cannot execute query."
+
     query = f"""
         SELECT
             Title,
@@ -55,29 +64,31 @@ def get_product_details_for_brand(tool_context: ToolContext):
             Brand
         FROM
             {constants.PROJECT}.{constants.DATASET_ID}.{constants.TABLE_ID}
-        WHERE brand LIKE '%{brand}%'
+        WHERE brand LIKE CONCAT('%', @brand, '%')
         LIMIT 3
     """
     query_job_config = bigquery.QueryJobConfig(
         query_parameters=[
-            bigquery.ScalarQueryParameter("parameter1", "STRING", brand)
+            bigquery.ScalarQueryParameter("brand", "STRING", brand)
         ]
     )
 
     query_job = client.query(query, job_config=query_job_config)
-    query_job = client.query(query)
     results = query_job.result()
 
-    markdown_table = "| Title | Description | Attributes | Brand |\n"
-    markdown_table += "|---|---|---|---|\n"
+    # Collect the rows and join once instead of growing a string per row.
+    markdown_rows = [
+        "| Title | Description | Attributes | Brand |\n",
+        "|---|---|---|---|\n",
+    ]
 
     for row in results:
         title = row.Title
         description = row.Description if row.Description else "N/A"
         attributes = row.Attributes if row.Attributes else "N/A"
 
-        markdown_table += (
-            f"| {title} | {description} | {attributes} | {brand}\n"
+        markdown_rows.append(
+            f"| {title} | {description} | {attributes} | {row.Brand}\n"
         )
 
-    return markdown_table
+    return "".join(markdown_rows)
@@ -53,7 +53,6 @@ def create(env_vars: dict) -> None:
             "webdriver-manager",
             "google-cloud-bigquery",
             "absl-py",
-            "pillow",
         ],
         extra_packages=extra_packages,
         env_vars=env_vars,
@@ -0,0 +1,108 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for search results tools"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from brand_search_optimization.sub_agents.search_results import agent
+from brand_search_optimization.sub_agents.search_results import prompt
+
+pytest_plugins = ("pytest_asyncio",)
+
+
+class TestSearchResultsTools:
+
+    @pytest.mark.asyncio
+    @patch.object(agent, "_get_driver")
+    async def test_take_screenshot_saves_driver_png(self, mock_get_driver):
+        png_bytes = b"\x89PNG\r\n\x1a\nfake-png-payload"
+        mock_get_driver.return_value.get_screenshot_as_png.return_value = (
+            png_bytes
+        )
+        mock_tool_context = MagicMock()
+        mock_tool_context.save_artifact = AsyncMock()
+
+        result = await agent.take_screenshot(mock_tool_context)
+
+        mock_tool_context.save_artifact.assert_awaited_once()
+        filename, part = mock_tool_context.save_artifact.await_args.args
+        assert result == {"status": "ok", "filename": filename}
+        assert part.inline_data.data == png_bytes
+        assert part.inline_data.mime_type == "image/png"
+
+    def test_analyze_webpage_matches_template(self):
+        user_task = "find {titles}"
+        page_source = "<p>Kids' Joggers</p>"
+
+        analysis_prompt = agent.analyze_webpage_and_determine_action(
+            page_source, user_task, MagicMock()
+        )
+
+        assert analysis_prompt == prompt.WEBPAGE_ANALYSIS_PROMPT.format(
+            user_task=user_task, page_source=page_source
+        )
+
+    @patch.object(agent, "_get_driver")
+    def test_get_page_source_strips_non_content_tags(self, mock_get_driver):
+        mock_get_driver.return_value.page_source = (
+            "<html><head>"
+            '<script type="application/ld+json">{"name": "ld"}</script>'
+            "<STYLE media=screen>.title { color: red; }</STYLE>"
+            "</head><body>"
+            "<noscript><img src=pixel.gif></noscript>"
+            '<div class="title">Kids\' Joggers</div>'
+            "<Script>var a = '<div>fake</div>';</sCRIPT >"
+            "<p>Light-Up Sneakers</p>"
+            "</body></html>"
+        )
+
+        page_source = agent.get_page_source()
+
+        assert "<script" not in page_source.lower()
+        assert "<style" not in page_source.lower()
+        assert "<noscript" not in page_source.lower()
+        assert "ld+json" not in page_source
+        assert "fake" not in page_source
+        assert "color: red" not in page_source
+        assert "pixel.gif" not in page_source
+        assert '<div class="title">Kids\' Joggers</div>' in page_source
+        assert "<p>Light-Up Sneakers</p>" in page_source
+
+    @patch.object(agent, "_get_driver")
+    def test_get_page_source_limit_applies_after_stripping(
+        self, mock_get_driver
+    ):
+        mock_get_driver.return_value.page_source = (
+            "<script>" + "x" * 100 + "</script><p>School Shoes</p>"
+        )
+
+        with patch.object(agent, "PAGE_SOURCE_LIMIT", 12):
+            page_source = agent.get_page_source()
+
+        assert page_source == "<p>School Sh"
+
+    @patch.object(agent, "_get_driver")
+    def test_get_page_source_collapses_whitespace(self, mock_get_driver):
+        mock_get_driver.return_value.page_source = (
+            "<ul>\n    <li>Kids' Joggers</li>\n\t\t<li>School  Shoes</li>\n</ul>"
+        )
+
+        page_source = agent.get_page_source()
+
+        assert page_source == (
+            "<ul> <li>Kids' Joggers</li> <li>School Shoes</li> </ul>"
+        )
@@ -64,3 +64,53 @@ class TestBrandSearchOptimization:
                     mock_tool_context
                 )
                 assert "neuravibe Pro" not in markdown_output
+
+    @patch("brand_search_optimization.tools.bq_connector.client")
+    def test_get_product_details_for_brand_empty_brand(self, mock_client):
+        mock_tool_context = MagicMock(spec=ToolContext)
+        mock_tool_context.user_content.parts = [MagicMock(text="   ")]
+
+        output = bq_connector.get_product_details_for_brand(mock_tool_context)
+
+        assert output == "No brand provided. Cannot execute query."
+        mock_client.query.assert_not_called()
+
+    @patch("brand_search_optimization.tools.bq_connector.client")
+    def test_get_product_details_for_brand_parameterized_query(
+        self, mock_client
+    ):
+        mock_tool_context = MagicMock(spec=ToolContext)
+        mock_tool_context.user_content.parts = [MagicMock(text="cymbal'")]
+
+        mock_query_job = MagicMock()
+        mock_query_job.result.return_value = []
+        mock_client.query.return_value = mock_query_job
+
+        bq_connector.get_product_details_for_brand(mock_tool_context)
+
+        mock_client.query.assert_called_once()
+        query = mock_client.query.call_args.args[0]
+        job_config = mock_client.query.call_args.kwargs["job_config"]
+        assert "cymbal'" not in query
+        assert "@brand" in query
+        assert job_config.query_parameters[0].value == "cymbal'"
+
+    @patch("brand_search_optimization.tools.bq_connector.client")
+    def test_get_product_details_for_brand_uses_row_brand(self, mock_client):
+        mock_tool_context = MagicMock(spec=ToolContext)
+        mock_tool_context.user_content.parts = [MagicMock(text="cym")]
+
+        mock_row = MagicMock(
+            Title="cymbal Air Max",
+            Description="Comfortable running shoes",
+            Attributes="Size: 10, Color: Blue",
+            Brand="cymbal",
+        )
+        mock_query_job = MagicMock()
+        mock_query_job.result.return_value = [mock_row]
+        mock_client.query.return_value = mock_query_job
+
+        markdown_output = bq_connector.get_product_details_for_brand(
+            mock_tool_context
+        )
+        assert "| Size: 10, Color: Blue | cymbal\n" in markdown_output